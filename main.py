@@ -1,155 +1,493 @@
-from fastapi import FastAPI, File, UploadFile, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
+import asyncio
+import httpx
+import logging
 import openai
+import orjson
+from openai import AsyncOpenAI
 import os
 import tempfile
-from typing import Dict
+import time
+from typing import IO, Any, AsyncIterator, Dict, List, Optional, Tuple, Union
+from starlette.datastructures import Headers, UploadFile
+from starlette.formparsers import MultiPartException, MultiPartParser
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 import uvicorn
 
-# Creează aplicația FastAPI
-app = FastAPI(title="Whisper Proxy API", version="1.0.0")
+# Configurează logging-ul doar pentru acest modul, fără a atinge root logger-ul
+# (și deci logging-ul httpx, openai sau uvicorn); nivelul se controlează prin LOG_LEVEL
+logger = logging.getLogger(__name__)
+logger.setLevel(os.getenv("LOG_LEVEL", "WARNING").upper())
+if not logger.handlers:
+    _log_handler = logging.StreamHandler()
+    _log_handler.setFormatter(logging.Formatter("%(levelname)s:%(name)s:%(message)s"))
+    logger.addHandler(_log_handler)
+    logger.propagate = False
+
+# Dimensiunea maximă a unui fișier audio; API-ul Whisper acceptă fișiere de cel mult 25 MB
+MAX_AUDIO_BYTES = int(os.getenv("MAX_AUDIO_BYTES", str(25 << 20)))
+# Corpul unei cereri multipart include și delimitatorii și header-ele formularului,
+# așa că limita pentru întreaga cerere lasă loc pentru acestea
+MULTIPART_OVERHEAD_BYTES = 64 << 10
+MAX_REQUEST_BYTES = MAX_AUDIO_BYTES + MULTIPART_OVERHEAD_BYTES
+TOO_LARGE_DETAIL = f"Fișierul audio depășește dimensiunea maximă de {MAX_AUDIO_BYTES} bytes"
+
+# Fișierele audio sub 8 MiB rămân în memorie, cele mai mari sunt scrise pe disc
+# (atât la /transcribe, cât și la /transcribe-raw)
+SPOOL_MAX_BYTES = 8 << 20
+
+
+class BodySizeLimitMiddleware:
+    """
+    Respinge cu 413 cererile al căror corp depășește `max_bytes`
+    
+    Content-Length este verificat înainte de a citi corpul, iar pentru cererile
+    fără acest header corpul este numărat pe măsură ce sosește, astfel încât un
+    upload prea mare este oprit fără a fi citit integral.
+    """
+    
+    def __init__(self, app: ASGIApp, max_bytes: int):
+        self.app = app
+        self.max_bytes = max_bytes
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        content_length = Headers(scope=scope).get("content-length", "")
+        if content_length.isdigit() and int(content_length) > self.max_bytes:
+            response = ORJSONResponse({"detail": TOO_LARGE_DETAIL}, status_code=413)
+            await response(scope, receive, send)
+            return
+        
+        received = 0
+        
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_bytes:
+                    raise HTTPException(status_code=413, detail=TOO_LARGE_DETAIL)
+            return message
+        
+        await self.app(scope, limited_receive, send)
+
+
+# Creează aplicația FastAPI; răspunsurile sunt serializate cu orjson
+app = FastAPI(
+    title="Whisper Proxy API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+)
+
+# Limitează dimensiunea corpului cererilor înainte ca FastAPI să-l citească;
+# limita exactă pentru fișierul audio este verificată în fiecare endpoint
+app.add_middleware(BodySizeLimitMiddleware, max_bytes=MAX_REQUEST_BYTES)
+
+# Nu folosim GZipMiddleware: fișierele audio (MP3/M4A/WebM) sunt deja comprimate,
+# iar răspunsurile JSON sunt mici, așa că o trecere prin zlib ar consuma doar CPU
 
 # Configurează CORS pentru a permite apeluri din base44
+# Domeniile permise se pot suprascrie prin CORS_ORIGINS (listă separată prin virgulă);
+# aplicațiile publicate pe *.base44.app sunt acceptate prin expresia regulată
+CORS_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv("CORS_ORIGINS", "https://app.base44.com").split(",")
+    if origin.strip()
+]
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # În producție, specifică doar domeniile necesare
+    allow_origins=CORS_ORIGINS,
+    allow_origin_regex=r"https://[a-z0-9-]+\.base44\.app",
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["content-type", "x-audio-filename"],
+    max_age=86400,  # Browserele pot păstra rezultatul preflight-ului 24h
 )
 
-# Configurează cheia API OpenAI (versiunea 0.28)
+# Configurează cheia API OpenAI
 openai_api_key = os.getenv("OPENAI_API_KEY")
 if not openai_api_key:
     raise ValueError("OPENAI_API_KEY nu este setată în variabilele de mediu!")
 
-# Setează cheia API pentru openai versiunea 0.28
-openai.api_key = openai_api_key
+# Un singur client asincron pentru toată aplicația, astfel încât apelurile
+# către Whisper să nu blocheze event loop-ul și să refolosească conexiunile.
+# Pool-ul HTTP/2 comun evită câte un handshake TLS pentru fiecare cerere.
+shared_http = httpx.AsyncClient(
+    http2=True,
+    limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+    timeout=120,
+)
+client = AsyncOpenAI(api_key=openai_api_key, http_client=shared_http)
+
+# Tipurile și extensiile de fișiere acceptate - verificare relaxată pentru base44
+ALLOWED_TYPES = frozenset({
+    "audio/wav", "audio/mpeg", "audio/mp4", "audio/m4a", "audio/webm",
+    "application/octet-stream", "audio/wave",
+})
+ALLOWED_EXTS = frozenset({".wav", ".mp3", ".m4a", ".webm", ".mp4"})
+# Câți bytes de la începutul fișierului sunt citiți pentru verificarea semnăturii
+AUDIO_SIGNATURE_BYTES = 12
+
+# Numărul maxim de apeluri simultane către OpenAI per worker; fiecare worker
+# uvicorn rulează un singur event loop, de care semaforul se leagă la prima așteptare
+MAX_INFLIGHT = int(os.getenv("MAX_INFLIGHT", "32"))
+_inflight = asyncio.Semaphore(MAX_INFLIGHT)
+# Timpul maxim (în secunde) de așteptare a unei transcrieri
+OPENAI_TIMEOUT = float(os.getenv("OPENAI_TIMEOUT", "60"))
+
+@app.on_event("shutdown")
+async def shutdown() -> None:
+    """Eliberează resursele la oprirea aplicației"""
+    await shared_http.aclose()
 
-@app.get("/")
-async def root():
+# Răspunsurile statice sunt construite o singură dată, la pornire
+ROOT_RESPONSE: Dict[str, Any] = {"message": "Whisper Proxy API funcționează!", "status": "OK"}
+TRANSCRIBE_INFO_RESPONSE: Dict[str, Any] = {
+    "message": "Endpoint pentru transcrierea audio",
+    "method": "POST",
+    "required": "Fișier audio în format multipart/form-data",
+    "supported_formats": ["wav", "mp3", "m4a", "webm"],
+    "example": "Folosiți POST cu un fișier audio pentru a obține transcrierea",
+    "stream": "Cu ?stream=true transcrierea este trimisă pe segmente, în format NDJSON",
+    "raw": "POST /transcribe-raw acceptă fișierul direct în corpul cererii (nume în X-Audio-Filename)"
+}
+HEALTH_RESPONSE: Dict[str, Any] = {"status": "healthy", "service": "whisper-proxy", "openai_version": openai.__version__}
+
+# Rutele cu răspunsuri fixe nu au response_model, ca sondele să nu treacă prin validarea pydantic
+@app.get("/", response_model=None)
+async def root() -> Dict[str, Any]:
     """Endpoint de test pentru a verifica dacă API-ul funcționează"""
-    return {"message": "Whisper Proxy API funcționează!", "status": "OK"}
+    return ROOT_RESPONSE
 
-@app.get("/transcribe")
-async def transcribe_info():
+@app.get("/transcribe", response_model=None)
+async def transcribe_info() -> Dict[str, Any]:
     """Informații despre endpoint-ul de transcriere (pentru accesul din browser)"""
-    return {
-        "message": "Endpoint pentru transcrierea audio",
-        "method": "POST",
-        "required": "Fișier audio în format multipart/form-data",
-        "supported_formats": ["wav", "mp3", "m4a", "webm"],
-        "example": "Folosiți POST cu un fișier audio pentru a obține transcrierea"
-    }
-
-@app.post("/transcribe")
-async def transcribe_audio(audio_file: UploadFile = File(...)) -> Dict[str, str]:
+    return TRANSCRIBE_INFO_RESPONSE
+
+# Rezultatul unei transcrieri: JSON obișnuit sau segmentele în format NDJSON
+TranscribeResult = Union[Dict[str, Any], StreamingResponse]
+
+async def iter_segments_ndjson(segments: List[Dict[str, Any]]) -> AsyncIterator[bytes]:
+    """Emite fiecare segment al transcrierii ca o linie NDJSON"""
+    for segment in segments:
+        yield orjson.dumps({
+            "text": segment["text"],
+            "start": segment["start"],
+            "end": segment["end"],
+        }) + b"\n"
+
+def validate_audio_type(content_type: Optional[str], filename: str) -> None:
+    """Respinge cu 400 fișierele care nu par a fi audio după content-type și extensie"""
+    # Acceptă fișiere fără content-type sau cu content-type generic; parametrii
+    # precum ";codecs=opus" (trimiși de MediaRecorder) nu contează
+    media_type = (content_type or "").split(";", 1)[0].strip().lower()
+    if media_type and media_type not in ALLOWED_TYPES:
+        # Verifică și extensia fișierului ca backup
+        ext = os.path.splitext(filename)[1].lower()
+        
+        if ext not in ALLOWED_EXTS:
+            raise HTTPException(
+                status_code=400, 
+                detail=f"Tipul fișierului nu este suportat. Content-type: {content_type}, Filename: {filename}"
+            )
+
+def audio_signature_ext(head: Union[bytes, bytearray]) -> Optional[str]:
     """
-    Transcrie un fișier audio folosind OpenAI Whisper
-    
-    Args:
-        audio_file: Fișierul audio de transcris (wav, mp3, m4a, etc.)
-    
+    Extensia formatului audio recunoscut după primii bytes ai fișierului
+
     Returns:
-        Dict cu transcrierea sau eroarea
+        Extensia (de ex. ".mp3") sau None dacă semnătura nu este a unui format acceptat de Whisper
     """
+    if head[:4] == b"RIFF" and head[8:12] == b"WAVE":
+        return ".wav"
+    if head[:3] == b"ID3":  # MP3 cu tag ID3
+        return ".mp3"
+    if len(head) > 1 and head[0] == 0xFF and head[1] & 0xE0 == 0xE0:  # cadru MPEG
+        return ".mp3"
+    if head[:4] == b"OggS":
+        return ".ogg"
+    if head[:4] == b"fLaC":
+        return ".flac"
+    if head[:4] == b"\x1aE\xdf\xa3":  # WebM/Matroska
+        return ".webm"
+    if head[4:8] == b"ftyp":  # MP4/M4A
+        return ".m4a"
+    return None
+
+def check_audio_signature(head: Union[bytes, bytearray]) -> str:
+    """
+    Respinge cu 415 fișierele al căror conținut nu începe cu o semnătură audio cunoscută
+
+    Returns:
+        Extensia formatului detectat, folosită pentru numele implicit al fișierului
+    """
+    ext = audio_signature_ext(head)
+    if ext is None:
+        raise HTTPException(
+            status_code=415,
+            detail="Conținutul fișierului nu corespunde unui format audio suportat"
+        )
+    return ext
+
+class AudioMultiPartParser(MultiPartParser):
+    """Parser multipart care păstrează în memorie fișierele de până la SPOOL_MAX_BYTES"""
+    max_file_size = SPOOL_MAX_BYTES
+
+def spooled_payload(audio: IO[bytes], size: Optional[int]) -> Union[bytes, IO[bytes]]:
+    """
+    Conținutul de trimis către OpenAI pentru un upload păstrat în SpooledTemporaryFile
     
-    # Verifică dacă fișierul a fost încărcat
-    if not audio_file:
-        raise HTTPException(status_code=400, detail="Nu a fost furnizat niciun fișier audio")
-    
-    # Debug info
-    print(f"Fișier primit: {audio_file.filename}")
-    print(f"Content-Type: {audio_file.content_type}")
-    print(f"Dimensiune: {audio_file.size if hasattr(audio_file, 'size') else 'necunoscută'}")
+    httpx apelează fileno() ca să afle dimensiunea fișierului, iar pe un
+    SpooledTemporaryFile asta îl mută pe disc. Upload-urile care încap în
+    SPOOL_MAX_BYTES sunt încă în memorie, așa că se trimit ca bytes.
+    """
+    if size is not None and size <= SPOOL_MAX_BYTES:
+        return audio.read()
+    return audio
+
+async def transcribe_file(audio: Union[bytes, IO[bytes]], filename: str, content_type: Optional[str],
+                          stream: bool) -> TranscribeResult:
+    """
+    Trimite un fișier audio deja validat către OpenAI Whisper
     
-    # Verifică tipul fișierului - verificare relaxată pentru base44
-    allowed_types = ["audio/wav", "audio/mpeg", "audio/mp4", "audio/m4a", "audio/webm", 
-                    "application/octet-stream", "audio/wave", None]
+    Args:
+        audio: Conținutul de transcris, ca bytes sau fișier poziționat la început
+        filename: Numele fișierului, trimis mai departe către OpenAI
+        content_type: Tipul fișierului, dacă este cunoscut
+        stream: Dacă este True, întoarce segmentele transcrierii în format NDJSON
     
-    # Acceptă fișiere fără content-type sau cu content-type generic
-    if audio_file.content_type and audio_file.content_type not in allowed_types:
-        # Verifică și extensia fișierului ca backup
-        filename = audio_file.filename or ""
-        allowed_extensions = [".wav", ".mp3", ".m4a", ".webm", ".mp4"]
+    Returns:
+        Dict cu transcrierea sau un StreamingResponse cu segmentele
+    """
+    try:
+        # Transcrie folosind OpenAI Whisper
+        # Fișierul este trimis direct, fără o copie suplimentară în memorie
+        logger.debug("Trimit fișierul către OpenAI Whisper...")
         
-        if not any(filename.lower().endswith(ext) for ext in allowed_extensions):
-            raise HTTPException(
-                status_code=400, 
-                detail=f"Tipul fișierului nu este suportat. Content-type: {audio_file.content_type}, Filename: {filename}"
+        # La expirarea timpului, apelul către OpenAI este anulat odată cu așteptarea
+        async with asyncio.timeout(OPENAI_TIMEOUT), _inflight:
+            transcript = await client.audio.transcriptions.create(
+                model="whisper-1",
+                file=(filename, audio, content_type or "audio/wav"),
+                language="ro",  # Setează limba română
+                # verbose_json include segmentele cu marcajele de timp
+                response_format="verbose_json" if stream else "json",
             )
-    
-    try:
-        # Citește conținutul fișierului
-        audio_content = await audio_file.read()
         
-        # Creează un fișier temporar pentru a-l trimite la OpenAI
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as temp_file:
-            temp_file.write(audio_content)
-            temp_file_path = temp_file.name
+        logger.debug("Transcrierea primită: %.100s...", transcript.text)
         
-        try:
-            # Transcrie folosind OpenAI Whisper (versiunea 0.28)
-            print("Trimit fișierul către OpenAI Whisper...")
-            
-            with open(temp_file_path, "rb") as audio:
-                transcript = openai.Audio.transcribe(
-                    model="whisper-1",
-                    file=audio,
-                    language="ro"  # Setează limba română
-                )
-            
-            print(f"Transcrierea primită: {transcript.get('text', '')[:100]}...")
-            
-            # În versiunea 0.28, transcript este un dicționar cu cheia 'text'
-            transcription_text = transcript.get("text", "") if isinstance(transcript, dict) else str(transcript)
-            
-            # Returnează rezultatul
-            return {
-                "success": True,
-                "transcription": transcription_text,
-                "filename": audio_file.filename
-            }
-            
-        finally:
-            # Șterge fișierul temporar
-            if os.path.exists(temp_file_path):
-                os.unlink(temp_file_path)
+        if stream:
+            segments = getattr(transcript, "segments", None)
+            if not segments:
+                # Fără segmente, transcrierea întreagă este trimisă ca o singură linie
+                segments = [{"text": transcript.text, "start": None, "end": None}]
+            return StreamingResponse(iter_segments_ndjson(segments), media_type="application/x-ndjson")
+        
+        transcription_text = transcript.text
+        
+        # Returnează rezultatul
+        return {
+            "success": True,
+            "transcription": transcription_text,
+            "filename": filename
+        }
             
+    except TimeoutError:
+        logger.warning("Transcrierea a depășit %ss", OPENAI_TIMEOUT)
+        raise HTTPException(
+            status_code=504,
+            detail=f"OpenAI nu a răspuns în {OPENAI_TIMEOUT:g} secunde"
+        )
     except Exception as e:
         # Gestionează erorile
-        print(f"Eroare la transcrierea audio: {str(e)}")
+        logger.exception("Eroare la transcrierea audio")
         raise HTTPException(
             status_code=500, 
             detail=f"Eroare la transcrierea audio: {str(e)}"
         )
 
-@app.get("/test-openai")
-async def test_openai_connection():
+# Schema formularului pentru documentația OpenAPI, fiindcă formularul se parsează manual
+TRANSCRIBE_REQUEST_BODY: Dict[str, Any] = {
+    "required": True,
+    "content": {
+        "multipart/form-data": {
+            "schema": {
+                "type": "object",
+                "required": ["audio_file"],
+                "properties": {"audio_file": {"type": "string", "format": "binary"}},
+            }
+        }
+    },
+}
+
+# FastAPI nu poate deriva un response_model dintr-o uniune cu StreamingResponse
+@app.post("/transcribe", response_model=None, openapi_extra={"requestBody": TRANSCRIBE_REQUEST_BODY})
+async def transcribe_audio(request: Request, stream: bool = False) -> TranscribeResult:
+    """
+    Transcrie un fișier audio folosind OpenAI Whisper
+    
+    Formularul se parsează cu AudioMultiPartParser, ca fișierele de până la
+    SPOOL_MAX_BYTES să rămână în memorie în loc de limita Starlette, de 1 MiB.
+    
+    Args:
+        request: Cererea multipart/form-data cu fișierul audio în câmpul audio_file
+            (wav, mp3, m4a, etc.)
+        stream: Dacă este True, răspunsul conține segmentele transcrierii în format NDJSON
+    
+    Returns:
+        Dict cu transcrierea sau eroarea
+    """
+    content_type = request.headers.get("content-type", "")
+    if content_type.split(";", 1)[0].strip().lower() != "multipart/form-data":
+        raise HTTPException(status_code=400, detail="Cererea trebuie trimisă ca multipart/form-data")
+    try:
+        form = await AudioMultiPartParser(request.headers, request.stream()).parse()
+    except MultiPartException as exc:
+        raise HTTPException(status_code=400, detail=exc.message)
+    
+    try:
+        audio_file = form.get("audio_file")
+        
+        # Verifică dacă fișierul a fost încărcat
+        if not isinstance(audio_file, UploadFile):
+            raise HTTPException(status_code=400, detail="Nu a fost furnizat niciun fișier audio")
+        
+        # Debug info
+        logger.debug(
+            "upload filename=%s ct=%s size=%s",
+            audio_file.filename, audio_file.content_type, audio_file.size,
+        )
+        
+        if audio_file.size == 0:
+            raise HTTPException(status_code=400, detail="Nu a fost furnizat niciun fișier audio")
+        if (audio_file.size or 0) > MAX_AUDIO_BYTES:
+            raise HTTPException(status_code=413, detail=TOO_LARGE_DETAIL)
+        
+        # Verifică tipul fișierului, apoi conținutul, înainte de a-l trimite la OpenAI
+        validate_audio_type(audio_file.content_type, audio_file.filename or "")
+        ext = check_audio_signature(await audio_file.read(AUDIO_SIGNATURE_BYTES))
+        
+        await audio_file.seek(0)
+        return await transcribe_file(
+            spooled_payload(audio_file.file, audio_file.size),
+            audio_file.filename or f"audio{ext}",
+            audio_file.content_type,
+            stream,
+        )
+    finally:
+        await form.close()
+
+@app.post("/transcribe-raw", response_model=None)
+async def transcribe_raw_audio(request: Request, stream: bool = False) -> TranscribeResult:
+    """
+    Transcrie un fișier audio trimis direct în corpul cererii, fără multipart/form-data
+    
+    Numele fișierului se transmite prin header-ul X-Audio-Filename, iar tipul prin
+    Content-Type. Corpul este copiat pe măsură ce sosește, fără parsarea formularului.
+    
+    Args:
+        request: Cererea HTTP cu fișierul audio în corp
+        stream: Dacă este True, răspunsul conține segmentele transcrierii în format NDJSON
+    
+    Returns:
+        Dict cu transcrierea sau eroarea
+    """
+    filename = request.headers.get("x-audio-filename", "")
+    content_type = request.headers.get("content-type")
+    
+    # Verifică tipul fișierului înainte de a citi corpul
+    validate_audio_type(content_type, filename)
+    
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES) as audio:
+        size = 0
+        head = bytearray()
+        ext: Optional[str] = None
+        async for chunk in request.stream():
+            # Verifică semnătura imediat ce au sosit primii bytes, fără a aștepta restul corpului
+            if len(head) < AUDIO_SIGNATURE_BYTES:
+                head += chunk[:AUDIO_SIGNATURE_BYTES - len(head)]
+                if len(head) == AUDIO_SIGNATURE_BYTES:
+                    ext = check_audio_signature(head)
+            size += len(chunk)
+            if size > MAX_AUDIO_BYTES:
+                raise HTTPException(status_code=413, detail=TOO_LARGE_DETAIL)
+            audio.write(chunk)
+        
+        logger.debug("upload raw filename=%s ct=%s size=%s", filename, content_type, size)
+        
+        # Verifică dacă fișierul a fost încărcat
+        if not size:
+            raise HTTPException(status_code=400, detail="Nu a fost furnizat niciun fișier audio")
+        if ext is None:
+            ext = check_audio_signature(head)
+        # Fără X-Audio-Filename, extensia implicită vine din formatul detectat
+        filename = filename or f"audio{ext}"
+        
+        audio.seek(0)
+        return await transcribe_file(spooled_payload(audio, size), filename, content_type, stream)
+
+# Cache pentru lista de modele, ca sondele repetate pe /test-openai
+# să nu genereze câte un apel către OpenAI
+MODELS_CACHE_TTL = 60.0
+_models_cache: Optional[Tuple[int, float]] = None  # (număr modele, expiră la)
+_models_lock = asyncio.Lock()
+
+async def get_models_count() -> int:
+    """Numărul de modele disponibile, reîmprospătat cel mult o dată la MODELS_CACHE_TTL secunde"""
+    global _models_cache
+    cached = _models_cache
+    if cached is not None and cached[1] > time.monotonic():
+        return cached[0]
+    
+    async with _models_lock:
+        # Altă cerere ar fi putut reîmprospăta cache-ul cât am așteptat lock-ul
+        if _models_cache is None or _models_cache[1] <= time.monotonic():
+            models = await client.models.list()
+            _models_cache = (len(models.data), time.monotonic() + MODELS_CACHE_TTL)
+        return _models_cache[0]
+
+@app.get("/test-openai", response_model=None)
+async def test_openai_connection() -> Dict[str, Any]:
     """Test pentru a verifica conectivitatea cu OpenAI"""
     try:
-        # Testează conexiunea cu OpenAI (versiunea 0.28)
-        models = openai.Model.list()
+        # Testează conexiunea cu OpenAI
+        models_count = await get_models_count()
         return {
             "status": "success",
             "message": "Conexiunea cu OpenAI funcționează",
             "api_key_present": bool(openai_api_key),
-            "openai_version": "0.28",
-            "models_count": len(models.get("data", [])) if hasattr(models, 'get') else 'unknown'
+            "openai_version": openai.__version__,
+            "models_count": models_count
         }
     except Exception as e:
         return {
             "status": "error", 
             "message": f"Eroare la conectarea cu OpenAI: {str(e)}",
             "api_key_present": bool(openai_api_key),
-            "openai_version": "0.28"
+            "openai_version": openai.__version__
         }
 
-@app.get("/health")
-async def health_check():
+@app.get("/health", response_model=None)
+async def health_check() -> Dict[str, Any]:
     """Endpoint pentru verificarea stării aplicației"""
-    return {"status": "healthy", "service": "whisper-proxy", "openai_version": "0.28"}
+    return HEALTH_RESPONSE
 
 # Pentru rularea locală (opțional)
+# Numărul de procese worker se controlează prin WEB_CONCURRENCY (implicit numărul de CPU-uri);
+# event loop-ul uvloop și parserul httptools înlocuiesc variantele pure Python
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1)),
+        # "auto" alege uvloop și httptools când sunt instalate și revine la
+        # asyncio / h11 altfel (uvloop nu există pe Windows)
+        loop="auto",
+        http="auto",
+    )
@@ -0,0 +1,53 @@
+import os
+import sys
+
+# main.py citește configurația la import
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+os.environ.setdefault("MAX_AUDIO_BYTES", str(4 << 20))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+from openai import AsyncOpenAI
+
+import main
+
+# Începutul unui fișier WAV valid, suficient pentru verificarea semnăturii
+WAV_HEADER = b"RIFF\x00\x00\x00\x00WAVEfmt "
+
+
+class FakeWhisper:
+    """
+    Înlocuiește API-ul OpenAI; înregistrează cererile și răspunde cu `response_json`
+
+    Cererile către /models sunt înregistrate separat și primesc `models_status`.
+    """
+
+    def __init__(self):
+        self.requests = []
+        self.response_json = {"text": "salut"}
+        self.model_requests = []
+        self.models_status = 200
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/models"):
+            self.model_requests.append(request)
+            models = {"object": "list", "data": [{"id": "whisper-1", "object": "model", "created": 0, "owned_by": "openai"}]}
+            return httpx.Response(self.models_status, json=models)
+        self.requests.append(request)
+        return httpx.Response(200, json=self.response_json)
+
+
+@pytest.fixture
+def whisper(monkeypatch):
+    fake = FakeWhisper()
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(fake))
+    monkeypatch.setattr(main, "client", AsyncOpenAI(api_key="test-key", http_client=http_client, max_retries=0))
+    monkeypatch.setattr(main, "_models_cache", None)
+    return fake
+
+
+@pytest.fixture
+def client(whisper):
+    return TestClient(main.app)
@@ -0,0 +1,56 @@
+import asyncio
+import io
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+import main
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    """Înlocuiește clientul OpenAI cu unul care așteaptă `delay` secunde la fiecare apel"""
+    state = SimpleNamespace(delay=0.01, active=0, max_active=0, cancelled=0)
+
+    async def create(**params):
+        state.active += 1
+        state.max_active = max(state.max_active, state.active)
+        try:
+            await asyncio.sleep(state.delay)
+        except asyncio.CancelledError:
+            state.cancelled += 1
+            raise
+        finally:
+            state.active -= 1
+        return SimpleNamespace(text=params["file"][0])
+
+    transcriptions = SimpleNamespace(create=create)
+    monkeypatch.setattr(main, "client", SimpleNamespace(audio=SimpleNamespace(transcriptions=transcriptions)))
+    return state
+
+
+def transcribe(name):
+    return main.transcribe_file(io.BytesIO(b""), name, "audio/wav", stream=False)
+
+
+def test_concurrent_calls_are_capped_by_max_inflight(upstream, monkeypatch):
+    async def run():
+        monkeypatch.setattr(main, "_inflight", asyncio.Semaphore(1))
+        return await asyncio.gather(*(transcribe(name) for name in "abc"))
+
+    results = asyncio.run(run())
+
+    assert [result["transcription"] for result in results] == ["a", "b", "c"]
+    assert upstream.max_active == 1
+
+
+def test_timeout_returns_504_and_cancels_the_upstream_call(upstream, monkeypatch):
+    upstream.delay = 10
+    monkeypatch.setattr(main, "OPENAI_TIMEOUT", 0.05)
+
+    with pytest.raises(HTTPException) as excinfo:
+        asyncio.run(transcribe("stuck"))
+
+    assert excinfo.value.status_code == 504
+    assert upstream.cancelled == 1
@@ -0,0 +1,219 @@
+import asyncio
+import tempfile
+
+import orjson
+import pytest
+
+import main
+from conftest import WAV_HEADER
+
+
+def test_transcribe_returns_json(client, whisper):
+    response = client.post("/transcribe", files={"audio_file": ("a.wav", WAV_HEADER, "audio/wav")})
+
+    assert response.status_code == 200
+    assert response.json() == {"success": True, "transcription": "salut", "filename": "a.wav"}
+    assert len(whisper.requests) == 1
+
+
+def test_probe_routes_skip_response_validation(client):
+    probes = {"/", "/transcribe", "/health", "/test-openai"}
+    routes = [route for route in main.app.routes if getattr(route, "path", None) in probes]
+
+    assert all(route.response_model is None for route in routes if "GET" in route.methods)
+    assert client.get("/health").json() == main.HEALTH_RESPONSE
+
+
+def test_request_over_content_length_limit_is_rejected_unread(client, whisper):
+    body = WAV_HEADER + b"0" * main.MAX_REQUEST_BYTES
+
+    response = client.post("/transcribe-raw", content=body, headers={"content-type": "audio/wav"})
+
+    assert response.status_code == 413
+    assert response.json() == {"detail": main.TOO_LARGE_DETAIL}
+    assert whisper.requests == []
+
+
+def test_request_without_content_length_is_cut_off_mid_stream(client, whisper):
+    def chunks():
+        yield WAV_HEADER
+        for _ in range(main.MAX_REQUEST_BYTES // (64 << 10) + 1):
+            yield b"0" * (64 << 10)
+
+    headers = {"content-type": "multipart/form-data; boundary=limit"}
+    response = client.post("/transcribe", content=chunks(), headers=headers)
+
+    assert response.status_code == 413
+    assert response.request.headers.get("content-length") is None
+    assert whisper.requests == []
+
+
+def test_file_at_the_limit_fits_in_multipart_framing(client, whisper):
+    audio = WAV_HEADER + b"0" * (main.MAX_AUDIO_BYTES - len(WAV_HEADER))
+
+    response = client.post("/transcribe", files={"audio_file": ("a.wav", audio, "audio/wav")})
+
+    assert response.status_code == 200
+
+
+def test_file_over_the_limit_is_rejected(client, whisper):
+    audio = WAV_HEADER + b"0" * (main.MAX_AUDIO_BYTES - len(WAV_HEADER) + 1)
+
+    multipart = client.post("/transcribe", files={"audio_file": ("a.wav", audio, "audio/wav")})
+    raw = client.post("/transcribe-raw", content=audio, headers={"content-type": "audio/wav"})
+
+    assert multipart.status_code == raw.status_code == 413
+    assert whisper.requests == []
+
+
+def test_stream_emits_one_ndjson_line_per_segment(client, whisper):
+    whisper.response_json = {
+        "text": "unu doi",
+        "segments": [
+            {"id": 0, "text": "unu", "start": 0.0, "end": 1.0},
+            {"id": 1, "text": "doi", "start": 1.0, "end": 2.5},
+        ],
+    }
+
+    response = client.post("/transcribe?stream=true", files={"audio_file": ("a.wav", WAV_HEADER, "audio/wav")})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert [orjson.loads(line) for line in response.text.splitlines()] == [
+        {"text": "unu", "start": 0.0, "end": 1.0},
+        {"text": "doi", "start": 1.0, "end": 2.5},
+    ]
+    assert b"verbose_json" in whisper.requests[0].content
+
+
+def test_stream_without_segments_falls_back_to_full_text(client, whisper):
+    whisper.response_json = {"text": "unu doi"}
+
+    response = client.post("/transcribe?stream=true", files={"audio_file": ("a.wav", WAV_HEADER, "audio/wav")})
+
+    assert response.status_code == 200
+    assert [orjson.loads(line) for line in response.text.splitlines()] == [
+        {"text": "unu doi", "start": None, "end": None},
+    ]
+
+
+@pytest.fixture
+def rollovers(monkeypatch):
+    """Înregistrează fiecare mutare pe disc a unui SpooledTemporaryFile"""
+    calls = []
+    rollover = tempfile.SpooledTemporaryFile.rollover
+
+    def recording_rollover(self):
+        calls.append(self)
+        rollover(self)
+
+    monkeypatch.setattr(tempfile.SpooledTemporaryFile, "rollover", recording_rollover)
+    return calls
+
+
+# 2 MiB depășește limita implicită Starlette, de 1 MiB, dar nu și SPOOL_MAX_BYTES
+SMALL_SIZES = [1 << 10, 2 << 20]
+
+
+@pytest.mark.parametrize("size", SMALL_SIZES)
+@pytest.mark.parametrize("url", ["/transcribe", "/transcribe?stream=true"])
+def test_small_multipart_upload_stays_in_memory(client, whisper, rollovers, url, size):
+    audio = WAV_HEADER + b"0" * size
+
+    response = client.post(url, files={"audio_file": ("a.wav", audio, "audio/wav")})
+
+    assert response.status_code == 200
+    assert rollovers == []
+    assert audio in whisper.requests[0].content
+
+
+@pytest.mark.parametrize("size", SMALL_SIZES)
+def test_small_raw_upload_stays_in_memory(client, whisper, rollovers, size):
+    audio = WAV_HEADER + b"0" * size
+    headers = {"content-type": "audio/wav", "x-audio-filename": "a.wav"}
+
+    response = client.post("/transcribe-raw", content=audio, headers=headers)
+
+    assert response.status_code == 200
+    assert response.json()["filename"] == "a.wav"
+    assert rollovers == []
+    assert audio in whisper.requests[0].content
+
+
+def test_empty_upload_is_reported_as_missing_not_as_wrong_format(client, whisper):
+    multipart = client.post("/transcribe", files={"audio_file": ("a.wav", b"", "audio/wav")})
+    raw = client.post("/transcribe-raw", content=b"", headers={"content-type": "audio/wav"})
+
+    assert multipart.status_code == raw.status_code == 400
+    assert multipart.json() == raw.json() == {"detail": "Nu a fost furnizat niciun fișier audio"}
+
+
+def test_multipart_without_audio_file_is_rejected(client, whisper):
+    missing = client.post("/transcribe", files={"other": ("a.wav", WAV_HEADER, "audio/wav")})
+    not_multipart = client.post("/transcribe", content=WAV_HEADER, headers={"content-type": "audio/wav"})
+
+    assert missing.status_code == not_multipart.status_code == 400
+    assert whisper.requests == []
+
+
+def test_raw_upload_with_codec_parameter_is_named_after_its_format(client, whisper):
+    webm = b"\x1aE\xdf\xa3" + b"0" * 64
+    mp3 = b"ID3" + b"0" * 64
+
+    webm_response = client.post("/transcribe-raw", content=webm, headers={"content-type": "audio/webm;codecs=opus"})
+    mp3_response = client.post("/transcribe-raw", content=mp3, headers={"content-type": "audio/mpeg"})
+
+    assert webm_response.status_code == mp3_response.status_code == 200
+    assert webm_response.json()["filename"] == "audio.webm"
+    assert mp3_response.json()["filename"] == "audio.mp3"
+    assert b'filename="audio.webm"' in whisper.requests[0].content
+
+
+def test_non_audio_content_is_rejected_before_upload(client, whisper):
+    response = client.post("/transcribe", files={"audio_file": ("a.wav", b"not audio at all", "audio/wav")})
+
+    assert response.status_code == 415
+    assert whisper.requests == []
+
+
+def test_logging_is_configured_only_for_this_module():
+    assert main.logger.handlers
+    assert not main.logger.propagate
+
+
+def test_models_count_is_cached_within_ttl(client, whisper):
+    first = client.get("/test-openai").json()
+    second = client.get("/test-openai").json()
+
+    assert first["status"] == second["status"] == "success"
+    assert first["models_count"] == second["models_count"] == 1
+    assert len(whisper.model_requests) == 1
+
+
+def test_models_count_refreshes_after_ttl(client, whisper, monkeypatch):
+    client.get("/test-openai")
+    monkeypatch.setattr(main, "_models_cache", (1, 0.0))
+
+    client.get("/test-openai")
+
+    assert len(whisper.model_requests) == 2
+
+
+def test_models_count_errors_are_not_cached(client, whisper):
+    whisper.models_status = 500
+    failed = client.get("/test-openai").json()
+    whisper.models_status = 200
+    recovered = client.get("/test-openai").json()
+
+    assert failed["status"] == "error"
+    assert recovered["status"] == "success"
+    assert len(whisper.model_requests) == 2
+
+
+def test_concurrent_refreshes_share_one_upstream_call(whisper, monkeypatch):
+    async def run():
+        monkeypatch.setattr(main, "_models_lock", asyncio.Lock())
+        return await asyncio.gather(*(main.get_models_count() for _ in range(5)))
+
+    assert asyncio.run(run()) == [1] * 5
+    assert len(whisper.model_requests) == 1